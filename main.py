@@ -1,7 +1,11 @@
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 
 app = FastAPI()
 
+# Pre-encoded JSON for the root greeting
+ROOT_BODY = orjson.dumps('Message: Welcome to the Student API!')
+
 @app.get("/",tags=["Root"])
-def read_root():
-    return 'Message: Welcome to the Student API!'
\ No newline at end of file
+async def read_root():
+    return Response(content=ROOT_BODY, media_type="application/json")
\ No newline at end of file
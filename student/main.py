@@ -1,75 +1,117 @@
-from fastapi import FastAPI, Depends, status, HTTPException #, Response
+import asyncio
+import orjson
+import os
+import uvicorn
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends, status, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
 from . import schemas, models
 from .database import engine, SessionLocal
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-app = FastAPI()
+async def create_tables():
+    # create_all checks for existing tables first, so calling it again is a no-op
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+    await engine.dispose()
 
-models.Base.metadata.create_all(engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await create_tables()
+    yield
+    await engine.dispose()
 
-def get_db():
-    db = SessionLocal()
-    try:
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Statements are built once and reused; each request only binds parameters
+students_table = models.Student.__table__
+SELECT_STUDENTS = select(students_table)
+INSERT_STUDENT = insert(students_table).returning(*students_table.c)
+UPDATE_STUDENT = update(students_table).where(students_table.c.id == bindparam("student_id"))
+DELETE_STUDENT = delete(students_table).where(students_table.c.id == bindparam("student_id"))
+
+class DuplicateStudentError(HTTPException):
+    # Subclassing HTTPException lets FastAPI's built-in handler render it directly
+    def __init__(self):
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail="Student with this email or phone already exists")
+
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+async def parse_student(request: Request) -> schemas.student:
+    # Only JSON media types are decoded, as FastAPI does for body params: a text/plain POST skips the CORS preflight
+    content_type = request.headers.get("content-type")
+    if content_type:
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        if media_type != "application/json" and not (media_type.startswith("application/") and media_type.endswith("+json")):
+            raise RequestValidationError([{"type": "content_type", "loc": ("body",), "msg": "Content-Type must be application/json", "input": content_type}])
+    # Validate the raw body inside pydantic-core instead of json.loads + dict validation
+    try:
+        return schemas.student.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)])
+
+student_body = {"requestBody": {"content": {"application/json": {"schema": schemas.student.model_json_schema()}}, "required": True}}
+
+def to_dict(student):
+    return {column.key: getattr(student, column.key) for column in students_table.columns}
+
+# Dashboard greeting is encoded once; each request still gets its own Response object
+ROOT_BODY = orjson.dumps('Message: Welcome to the Student API!')
 
 @app.get("/", tags=["Student_Dashboard"])
-def read_Student_Dashboard():
-    return 'Message: Welcome to the Student API!'
-
-@app.post("/Student", tags=["Student_Dashboard"], status_code=status.HTTP_201_CREATED)
-def create_student(request: schemas.student, db:Session = Depends(get_db)):
-    new_student = models.Student(
-        name=request.name,
-        email=request.email,
-        phone=request.phone,
-        DoB=request.DoB,
-        gender=request.gender,
-        course=request.course,
-        college=request.college
-    )
-    db.add(new_student)
-    db.commit()
-    db.refresh(new_student)
-    return new_student
+async def read_Student_Dashboard():
+    return Response(content=ROOT_BODY, media_type="application/json")
+
+@app.post("/Student", tags=["Student_Dashboard"], status_code=status.HTTP_201_CREATED, openapi_extra=student_body)
+async def create_student(request: schemas.student = Depends(parse_student), db:AsyncSession = Depends(get_db)):
+    try:
+        new_student = (await db.execute(INSERT_STUDENT, request.model_dump(mode="json"))).mappings().one()
+    except IntegrityError:
+        raise DuplicateStudentError()
+    await db.commit()
+    return dict(new_student)
 
 @app.get("/Student",tags=["Student_Dashboard"])
-def get_all_students(db:Session = Depends(get_db)):
-    students = db.query(models.Student).all()
-    return students
+async def get_all_students(db:AsyncSession = Depends(get_db)):
+    students = (await db.execute(SELECT_STUDENTS)).mappings().all()
+    return ORJSONResponse(content=[dict(student) for student in students])
 
 @app.get("/Student/{student_id}",tags=["Student_Dashboard"], status_code=status.HTTP_200_OK )
-def get_student(student_id:int, db:Session = Depends(get_db)):
-    student = db.query(models.Student).filter(models.Student.id == student_id).first()
+async def get_student(student_id:int, db:AsyncSession = Depends(get_db)):
+    student = await db.get(models.Student, student_id)
     if not student:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Student with the id {student_id} is not available")
         # response.status_code = status.HTTP_404_NOT_FOUND
         # return {"Message": f"Student with the id {student_id} is not available"}
-    return student
+    return ORJSONResponse(content=to_dict(student))
 
-@app.put("/student/{student_id}",tags=["Student_Dashboard"], status_code=status.HTTP_202_ACCEPTED)
-def update_student(student_id:int, request:schemas.student,db:Session=Depends(get_db)):
-    student = db.query(models.Student).filter(models.Student.id == student_id)
-    if not student.first():
+@app.put("/student/{student_id}",tags=["Student_Dashboard"], status_code=status.HTTP_202_ACCEPTED, openapi_extra=student_body)
+async def update_student(student_id:int, request:schemas.student = Depends(parse_student),db:AsyncSession=Depends(get_db)):
+    try:
+        result = await db.execute(UPDATE_STUDENT, {**request.model_dump(mode="json"), "student_id": student_id})
+    except IntegrityError:
+        raise DuplicateStudentError()
+    if result.rowcount == 0:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Student with the id {student_id} is not available")
-    student.update({
-        models.Student.name: request.name,
-        models.Student.email: request.email,
-        models.Student.phone: request.phone,
-        models.Student.DoB: request.DoB,
-        models.Student.course: request.course,
-        models.Student.college: request.college,
-        models.Student.gender: request.gender
-    })
-    db.commit()
+    await db.commit()
     return f"Student with the id {student_id} is updated successfully"
 
 @app.delete("/Student/{student_id}",tags=["Student_Dashboard"], status_code=status.HTTP_204_NO_CONTENT)
-def delete_student(student_id:int, db:Session = Depends(get_db)):
-    student = db.query(models.Student).filter(models.Student.id == student_id)
-    if not student.first():
+async def delete_student(student_id:int, db:AsyncSession = Depends(get_db)):
+    result = await db.execute(DELETE_STUDENT, {"student_id": student_id})
+    if result.rowcount == 0:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Student with the id {student_id} is not available")
-    student.delete(synchronize_session=False)
-    db.commit()
+    await db.commit()
     return {"Message": "Deleted Successfully"}
+
+if __name__ == "__main__":
+    # python -m student.main: one worker per core, uvloop/httptools picked up automatically when installed.
+    # Create the schema in the parent first so the workers' lifespan finds it and doesn't race on CREATE TABLE.
+    asyncio.run(create_tables())
+    uvicorn.run("student.main:app", host="0.0.0.0", port=8000, access_log=False, workers=os.cpu_count())
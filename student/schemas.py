@@ -1,11 +1,12 @@
-from pydantic import BaseModel, EmailStr, Field
+from datetime import date
+from typing import Annotated
+from pydantic import BaseModel, EmailStr, Field, StringConstraints
 
 class student(BaseModel):
     name: str
     email: EmailStr
-    phone: str = Field(...,pattern=r'^\+91\d{1,12}$',description="with country code")
-    DoB: str = Field(...,pattern=r'^\d{4}-\d{2}-\d{2}$',description="YYYY-MM-DD format")
-    gender: str = Field(...,pattern="^(Male|Female|Other)$")
-    course: str 
+    phone: Annotated[str, StringConstraints(pattern=r'^\+91\d{1,12}$'), Field(description="with country code")]
+    DoB: Annotated[date, Field(description="YYYY-MM-DD format")]
+    gender: Annotated[str, StringConstraints(pattern="^(Male|Female|Other)$")]
+    course: str
     college: str
-    
\ No newline at end of file